@@ -1,12 +1,56 @@
 import os
+import atexit
 import logging
+import logging.handlers
+import queue
+import threading
 import time
+from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# 로그 포맷에서 사용하지 않는 LogRecord 속성 수집 비활성화 (스레드/프로세스 정보 조회 비용 제거)
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# 로그 레벨 매핑
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL
+}
+
+def _resolve_log_level() -> int:
+    return _LOG_LEVELS.get(os.getenv("LOG_LEVEL", "INFO").strip().upper(), logging.INFO)
+
+# 환경변수 LOG_LEVEL은 모듈 로드 시 1회만 해석 (변경 반영은 refresh_log_level 사용)
+_RESOLVED_LOG_LEVEL = _resolve_log_level()
+
+# 로그 레벨 번호 -> 1자리 레벨명
+_LEVEL_SHORT = {
+    logging.DEBUG: 'D',
+    logging.INFO: 'I',
+    logging.WARNING: 'W',
+    logging.ERROR: 'E',
+    logging.CRITICAL: 'C'
+}
+
+# (name, command_name) -> 설정 완료된 로거 캐시
+_LOGGER_CACHE: dict[tuple, logging.Logger] = {}
+
+# 이미 생성을 확인한 로그 디렉토리
+_ensured_dirs: set[str] = set()
+
+# 로그 파일 경로 -> (큐, 백그라운드 리스너)
+_FILE_LISTENERS: dict[str, tuple] = {}
+_FILE_LISTENERS_LOCK = threading.Lock()
+
 def cleanup_old_logs(log_dir: str, days: int = 7):
     """
     지정된 일수보다 오래된 로그 파일 삭제
@@ -21,42 +65,201 @@ def cleanup_old_logs(log_dir: str, days: int = 7):
     current_time = time.time()
     cutoff_time = current_time - (days * 24 * 60 * 60)
     
-    for log_file in Path(log_dir).glob("*.log"):
-        if log_file.stat().st_mtime < cutoff_time:
+    # 디렉토리를 한 번만 순회 (DirEntry.stat()은 플랫폼이 캐시하는 경우,
+    # 예: Windows에서 디렉토리 조회 정보를 재사용하여 추가 시스템 콜이 없음)
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".log"):
+                continue
             try:
-                log_file.unlink()
+                if entry.stat(follow_symlinks=False).st_mtime < cutoff_time:
+                    os.unlink(entry.path)
             except Exception:
                 pass
 
+def cleanup_old_logs_daily(log_dir: str, days: int = 7):
+    """
+    cleanup_old_logs를 하루에 최대 1회만 수행합니다.
+    마지막 정리 시각은 로그 디렉토리의 .last_cleanup 파일 수정 시각으로 판단합니다.
+    
+    Args:
+        log_dir: 로그 디렉토리 경로
+        days: 보관 일수 (기본값: 7일)
+    """
+    marker = os.path.join(log_dir, ".last_cleanup")
+    try:
+        if time.time() - os.path.getmtime(marker) < 24 * 60 * 60:
+            return
+    except OSError:
+        pass
+    
+    cleanup_old_logs(log_dir, days=days)
+    try:
+        Path(marker).touch()
+    except OSError:
+        pass
+
 class CustomFormatter(logging.Formatter):
     """
     커스텀 로그 포맷터 - 타임스탬프와 1자리 로그 레벨을 포함
+    
+    출력 형식은 LOG_FORMAT으로 고정되어 있으며, % 스타일 치환 대신 f-string으로
+    직접 조립합니다. 다른 fmt를 지정하면 ValueError가 발생합니다.
     """
-    LEVEL_MAP = {
-        'DEBUG': 'D',
-        'INFO': 'I',
-        'WARNING': 'W',
-        'ERROR': 'E',
-        'CRITICAL': 'C'
-    }
+    LOG_FORMAT = '%(asctime)s [%(levelname_short)s] : %(message)s'
+    
+    def __init__(self, fmt=None, datefmt=None, **kwargs):
+        if fmt is not None and fmt != self.LOG_FORMAT:
+            raise ValueError(f"CustomFormatter는 고정 형식만 지원합니다: {self.LOG_FORMAT!r} (입력: {fmt!r})")
+        super().__init__(self.LOG_FORMAT, datefmt, **kwargs)
     
     def format(self, record):
-        record.levelname_short = self.LEVEL_MAP.get(record.levelname, record.levelname[0])
-        return super().format(record)
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record, self.datefmt)
+        # 레벨 번호 기준으로 매번 계산 (makeLogRecord 등으로 생성 후 변경된 레벨도 반영)
+        record.levelname_short = _LEVEL_SHORT.get(record.levelno) or record.levelname[:1]
+        s = f"{record.asctime} [{record.levelname_short}] : {record.message}"
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if s[-1:] != "\n":
+                s = s + "\n"
+            s = s + record.exc_text
+        if record.stack_info:
+            if s[-1:] != "\n":
+                s = s + "\n"
+            s = s + self.formatStack(record.stack_info)
+        return s
+    
+    # 마지막으로 포맷한 (초, datefmt, 문자열) - 같은 초 내에서는 밀리초만 갱신
+    _last_time = (-1, None, "")
     
     def formatTime(self, record, datefmt=None):
-        from datetime import datetime
-        ct = datetime.fromtimestamp(record.created)
-        if datefmt:
-            s = ct.strftime(datefmt)
+        sec = int(record.created)
+        last_sec, last_fmt, s = self._last_time
+        if sec != last_sec or datefmt != last_fmt:
+            s = datetime.fromtimestamp(sec).strftime(datefmt or "%Y-%m-%d %H:%M:%S")
+            self._last_time = (sec, datefmt, s)
+        return "%s.%03d" % (s, record.msecs)
+
+# 모든 핸들러가 공유하는 포맷터 (포맷 문자열은 1회만 컴파일)
+_FORMATTER = CustomFormatter(datefmt='%Y-%m-%d %H:%M:%S')
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    큰 버퍼로 파일을 열고 레코드마다 flush하지 않는 파일 핸들러.
+    버퍼 내용은 핸들러별 백그라운드 스레드가 flush_interval(초)마다 기록합니다.
+    """
+    BUFFER_SIZE = 65536
+    
+    def __init__(self, filename, mode='a', encoding=None, delay=False, flush_interval: float = 0.2):
+        self.flush_interval = flush_interval
+        self._deferring_flush = False
+        self._flusher_stop = threading.Event()
+        super().__init__(filename, mode=mode, encoding=encoding, delay=delay)
+        self._flusher = threading.Thread(target=self._flush_periodically, daemon=True,
+                                         name=f"BufferedFileHandler-{os.path.basename(filename)}")
+        self._flusher.start()
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.BUFFER_SIZE, encoding=self.encoding)
+    
+    def _flush_periodically(self):
+        while not self._flusher_stop.wait(self.flush_interval):
+            logging.FileHandler.flush(self)
+    
+    def emit(self, record):
+        # 기본 emit은 레코드마다 flush하므로 emit 중의 flush만 건너뜀 (handle()이 잠금을 보유)
+        self._deferring_flush = True
+        try:
+            super().emit(record)
+        finally:
+            self._deferring_flush = False
+    
+    def flush(self):
+        if not self._deferring_flush:
+            super().flush()
+    
+    def close(self):
+        # logging.shutdown() 등은 핸들러 잠금을 잡은 채 close()를 호출하므로 join하지 않음
+        # (flusher는 종료 신호를 보고 스스로 끝나며, 닫힌 뒤의 flush는 stream이 None이라 무시됨)
+        self._flusher_stop.set()
+        super().close()
+
+def _get_file_queue(log_filepath: str) -> queue.SimpleQueue:
+    """
+    로그 파일별 큐를 반환합니다. 최초 호출 시 해당 파일에 기록하는
+    QueueListener를 백그라운드 스레드로 시작합니다.
+    
+    Args:
+        log_filepath: 로그 파일 경로
+    
+    Returns:
+        QueueHandler에 연결할 큐
+    """
+    # 작업 디렉토리가 바뀌어도 다른 파일과 혼동하지 않도록 절대 경로로 관리
+    log_filepath = os.path.abspath(log_filepath)
+    with _FILE_LISTENERS_LOCK:
+        entry = _FILE_LISTENERS.get(log_filepath)
+        if entry is None:
+            log_queue = queue.SimpleQueue()
+            file_handler = BufferedFileHandler(log_filepath, mode='a', encoding='utf-8')
+            file_handler.setFormatter(_FORMATTER)
+            listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+            listener.start()
+            entry = (log_queue, listener)
+            _FILE_LISTENERS[log_filepath] = entry
+    return entry[0]
+
+def _detach_queue_handlers(queues: list):
+    """
+    정지된 큐에 연결된 QueueHandler를 로거에서 제거하고 설정 표시를 지워,
+    다음 get_logger 호출 시 새 리스너로 다시 구성되도록 합니다.
+    """
+    loggers = [logging.getLogger()] + [
+        logger for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    ]
+    for logger in loggers:
+        stale = [
+            handler for handler in logger.handlers
+            if isinstance(handler, logging.handlers.QueueHandler)
+            and any(handler.queue is q for q in queues)
+        ]
+        if stale:
+            for handler in stale:
+                logger.removeHandler(handler)
+            logger.__dict__.pop('_csa_setup_key', None)
+
+def _stop_file_listeners(log_filepaths: list = None):
+    """
+    남은 로그를 모두 기록하고 파일 리스너를 정지합니다. (프로세스 종료 시 전체 정지)
+    
+    Args:
+        log_filepaths: 정지할 로그 파일 경로 목록 (기본값: None - 전체)
+    """
+    with _FILE_LISTENERS_LOCK:
+        if log_filepaths is None:
+            log_filepaths = list(_FILE_LISTENERS)
         else:
-            s = ct.strftime("%Y-%m-%d %H:%M:%S")
-        s = f"{s}.{int(record.msecs):03d}"
-        return s
+            log_filepaths = [os.path.abspath(path) for path in log_filepaths]
+        stopped_queues = []
+        for log_filepath in log_filepaths:
+            entry = _FILE_LISTENERS.pop(log_filepath, None)
+            if entry is None:
+                continue
+            log_queue, listener = entry
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+            stopped_queues.append(log_queue)
+    _detach_queue_handlers(stopped_queues)
+
+atexit.register(_stop_file_listeners)
 
 def setup_logger(name: str = None, command_name: str = None) -> logging.Logger:
     """
-    환경변수에서 LOG_LEVEL을 읽어서 로거를 설정합니다.
+    환경변수 LOG_LEVEL에 따라 로거를 설정합니다.
     
     Args:
         name: 로거 이름 (기본값: None)
@@ -65,22 +268,16 @@ def setup_logger(name: str = None, command_name: str = None) -> logging.Logger:
     Returns:
         설정된 로거 객체
     """
-    # 환경변수에서 로그 레벨 읽기
-    log_level_str = os.getenv("LOG_LEVEL", "INFO").strip().upper()
-    
-    # 로그 레벨 매핑
-    log_levels = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "WARNING": logging.WARNING,
-        "ERROR": logging.ERROR,
-        "CRITICAL": logging.CRITICAL
-    }
-    
-    log_level = log_levels.get(log_level_str, logging.INFO)
+    log_level = _RESOLVED_LOG_LEVEL
     
     # 로거 생성
     logger = logging.getLogger(name)
+    
+    # 동일한 설정으로 이미 구성된 로거면 핸들러를 다시 만들지 않음
+    setup_key = (log_level, command_name)
+    if getattr(logger, '_csa_setup_key', None) == setup_key:
+        return logger
+    
     logger.setLevel(log_level)
     
     # 핸들러가 이미 있으면 제거 (중복 방지)
@@ -90,42 +287,42 @@ def setup_logger(name: str = None, command_name: str = None) -> logging.Logger:
     # 콘솔 핸들러 생성
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
-    
-    # 포맷터 생성
-    formatter = CustomFormatter('%(asctime)s [%(levelname_short)s] : %(message)s',
-                               datefmt='%Y-%m-%d %H:%M:%S')
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_FORMATTER)
     
     # 핸들러 추가
     logger.addHandler(console_handler)
     
     # 파일 핸들러 추가 (command_name이 있을 때만)
     if command_name:
-        from datetime import datetime
         log_dir = "logs"
-        os.makedirs(log_dir, exist_ok=True)
+        if log_dir not in _ensured_dirs:
+            os.makedirs(log_dir, exist_ok=True)
+            _ensured_dirs.add(log_dir)
         
-        # 7일 이상 된 로그 파일 삭제
-        cleanup_old_logs(log_dir, days=7)
+        # 7일 이상 된 로그 파일 삭제 (하루 1회)
+        cleanup_old_logs_daily(log_dir, days=7)
         
         # 로그 파일명: {작업명}-YYYYMMDD.log
         log_date = datetime.now().strftime("%Y%m%d")
         log_filename = f"{command_name}-{log_date}.log"
         log_filepath = os.path.join(log_dir, log_filename)
         
-        file_handler = logging.FileHandler(log_filepath, mode='a', encoding='utf-8')
-        file_handler.setLevel(log_level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        # 파일 기록은 큐를 통해 백그라운드 스레드에서 처리 (호출 스레드 블로킹 방지)
+        queue_handler = logging.handlers.QueueHandler(_get_file_queue(log_filepath))
+        queue_handler.setLevel(log_level)
+        logger.addHandler(queue_handler)
     
     # 부모 로거로 전파하지 않음 (중복 출력 방지)
     logger.propagate = False
+    logger._csa_setup_key = setup_key
     
     return logger
 
 def get_logger(name: str = None, command_name: str = None) -> logging.Logger:
     """
-    로거를 가져옵니다. 환경변수 변경을 반영하기 위해 항상 새로 설정합니다.
+    로거를 가져옵니다. 동일한 (name, command_name) 조합은 최초 1회만 설정하고
+    이후에는 캐시된 로거를 반환합니다. 같은 이름의 로거가 그 사이 다른
+    command_name으로 재설정되었다면 요청한 설정으로 다시 구성합니다.
     
     Args:
         name: 로거 이름 (기본값: None)
@@ -134,4 +331,32 @@ def get_logger(name: str = None, command_name: str = None) -> logging.Logger:
     Returns:
         로거 객체
     """
-    return setup_logger(name, command_name)
+    key = (name, command_name)
+    logger = _LOGGER_CACHE.get(key)
+    # logging.getLogger(name)은 이름별로 같은 객체이므로 현재 설정이 요청과 일치하는지 확인
+    if logger is None or getattr(logger, '_csa_setup_key', None) != (_RESOLVED_LOG_LEVEL, command_name):
+        logger = setup_logger(name, command_name)
+        _LOGGER_CACHE[key] = logger
+    return logger
+
+def reset_logger_cache():
+    """
+    로거 캐시를 비우고 캐시된 로거의 설정 표시를 지워, 다음 get_logger 호출 시
+    핸들러를 새로 구성하도록 합니다. (테스트 등에서 로거를 다시 설정할 때 사용)
+    """
+    for logger in _LOGGER_CACHE.values():
+        logger.__dict__.pop('_csa_setup_key', None)
+    _LOGGER_CACHE.clear()
+
+def refresh_log_level() -> int:
+    """
+    환경변수 LOG_LEVEL을 다시 읽어 로그 레벨을 갱신합니다.
+    이후 get_logger 호출 시 새 레벨로 로거가 다시 설정됩니다.
+    
+    Returns:
+        갱신된 로그 레벨
+    """
+    global _RESOLVED_LOG_LEVEL
+    _RESOLVED_LOG_LEVEL = _resolve_log_level()
+    reset_logger_cache()
+    return _RESOLVED_LOG_LEVEL
@@ -2,146 +2,125 @@
 Neo4j 데이터베이스 접속 테스트
 
 이 테스트는 Neo4j 데이터베이스에 접속하여 연결 상태를 확인합니다.
+드라이버는 테스트 세션 전체에서 하나만 생성하여 공유합니다.
 """
 
+import functools
+import os
+from dataclasses import dataclass
+
 import pytest
+from dotenv import load_dotenv
 from neo4j import GraphDatabase
-import os
 
+from csa.utils.logger import get_logger
 
-class TestNeo4jConnection:
-    """Neo4j 데이터베이스 접속 테스트 클래스"""
-    
-    # 접속 정보
-    NEO4J_URI = "neo4j://127.0.0.1:7687"
-    NEO4J_DATABASE = "csadb01"
-    NEO4J_USER = "csauser"
-    NEO4J_PASSWORD = "csauser123"
-    
-    def test_neo4j_connection(self):
-        """Neo4j 데이터베이스 접속 테스트"""
-        driver = None
-        try:
-            print(f"\n=== Neo4j 접속 테스트 시작 ===")
-            print(f"URI: {self.NEO4J_URI}")
-            print(f"Database: {self.NEO4J_DATABASE}")
-            print(f"User: {self.NEO4J_USER}")
-            
-            # Neo4j 드라이버 생성
-            driver = GraphDatabase.driver(
-                self.NEO4J_URI, 
-                auth=(self.NEO4J_USER, self.NEO4J_PASSWORD)
-            )
-            
-            # 연결 테스트
-            with driver.session(database=self.NEO4J_DATABASE) as session:
-                # 간단한 쿼리 실행하여 연결 확인
-                result = session.run("RETURN 1 as test_value")
-                record = result.single()
-                
-                assert record is not None, "쿼리 결과가 None입니다"
-                assert record["test_value"] == 1, f"예상값 1, 실제값: {record['test_value']}"
-                
-                print(f"✓ 접속 성공! 테스트 값: {record['test_value']}")
-                
-        except Exception as e:
-            print(f"✗ 접속 실패: {str(e)}")
-            print(f"에러 타입: {type(e).__name__}")
-            raise
-        finally:
-            if driver:
-                driver.close()
-                print("✓ 드라이버 연결 종료")
-    
-    def test_neo4j_connection_without_database(self):
-        """기본 데이터베이스로 접속 테스트"""
-        driver = None
-        try:
-            print(f"\n=== Neo4j 기본 데이터베이스 접속 테스트 ===")
-            print(f"URI: {self.NEO4J_URI}")
-            print(f"User: {self.NEO4J_USER}")
-            
-            # Neo4j 드라이버 생성
-            driver = GraphDatabase.driver(
-                self.NEO4J_URI, 
-                auth=(self.NEO4J_USER, self.NEO4J_PASSWORD)
-            )
-            
-            # 기본 데이터베이스로 연결 테스트
-            with driver.session() as session:
-                # 간단한 쿼리 실행하여 연결 확인
-                result = session.run("RETURN 1 as test_value")
-                record = result.single()
-                
-                assert record is not None, "쿼리 결과가 None입니다"
-                assert record["test_value"] == 1, f"예상값 1, 실제값: {record['test_value']}"
-                
-                print(f"✓ 기본 데이터베이스 접속 성공! 테스트 값: {record['test_value']}")
-                
-        except Exception as e:
-            print(f"✗ 기본 데이터베이스 접속 실패: {str(e)}")
-            print(f"에러 타입: {type(e).__name__}")
-            raise
-        finally:
-            if driver:
-                driver.close()
-                print("✓ 드라이버 연결 종료")
-    
-    def test_neo4j_database_info(self):
-        """Neo4j 데이터베이스 정보 조회 테스트"""
-        driver = None
-        try:
-            print(f"\n=== Neo4j 데이터베이스 정보 조회 테스트 ===")
-            
-            driver = GraphDatabase.driver(
-                self.NEO4J_URI, 
-                auth=(self.NEO4J_USER, self.NEO4J_PASSWORD)
-            )
-            
-            with driver.session(database=self.NEO4J_DATABASE) as session:
-                # 데이터베이스 정보 조회
-                result = session.run("CALL db.info()")
-                records = list(result)
-                
-                if records:
-                    print(f"✓ 데이터베이스 정보 조회 성공")
-                    for record in records:
-                        print(f"  - {dict(record)}")
-                else:
-                    print("⚠ 데이터베이스 정보가 없습니다")
-                
-                # 노드 개수 확인
-                result = session.run("MATCH (n) RETURN count(n) as node_count")
-                record = result.single()
-                node_count = record["node_count"] if record else 0
-                print(f"  - 총 노드 개수: {node_count}")
-                
-        except Exception as e:
-            print(f"✗ 데이터베이스 정보 조회 실패: {str(e)}")
-            print(f"에러 타입: {type(e).__name__}")
-            # 이 테스트는 실패해도 전체 테스트를 중단하지 않음
-            pytest.skip(f"데이터베이스 정보 조회 실패: {str(e)}")
-        finally:
-            if driver:
-                driver.close()
+# Load environment variables
+load_dotenv()
 
 
-if __name__ == "__main__":
-    # 직접 실행 시 테스트 수행
-    test_instance = TestNeo4jConnection()
-    
-    print("=" * 50)
-    print("Neo4j 데이터베이스 접속 테스트")
-    print("=" * 50)
-    
+@dataclass(frozen=True)
+class Neo4jConfig:
+    """Neo4j 접속 정보"""
+    uri: str
+    database: str
+    user: str
+    password: str
+
+
+@functools.cache
+def _neo4j_config() -> Neo4jConfig:
+    """환경변수에서 접속 정보를 1회만 읽어 공유 (미설정 시 기본값 사용)"""
+    return Neo4jConfig(
+        uri=os.getenv("NEO4J_URI", "neo4j://127.0.0.1:7687"),
+        database=os.getenv("NEO4J_DATABASE", "csadb01"),
+        user=os.getenv("NEO4J_USER", "csauser"),
+        password=os.getenv("NEO4J_PASSWORD", "csauser123"),
+    )
+
+
+@pytest.fixture(scope="session")
+def logger():
+    """테스트 진행 로그 (콘솔 + logs/tests-YYYYMMDD.log)
+
+    모듈 import(테스트 수집) 시 로그 디렉토리/리스너가 생성되지 않도록 fixture에서 생성합니다.
+    """
+    return get_logger(__name__, command_name="tests")
+
+
+@pytest.fixture(scope="session")
+def neo4j_driver(logger):
+    """테스트 세션 전체에서 공유하는 Neo4j 드라이버"""
+    config = _neo4j_config()
+    driver = GraphDatabase.driver(config.uri, auth=(config.user, config.password))
+    yield driver
+    driver.close()
+    logger.info("✓ 드라이버 연결 종료")
+
+
+@pytest.fixture(scope="session")
+def neo4j_session(neo4j_driver):
+    """설정된 데이터베이스에 연결된 공유 세션"""
+    with neo4j_driver.session(database=_neo4j_config().database) as session:
+        yield session
+
+
+@pytest.mark.parametrize("database", [_neo4j_config().database, None],
+                         ids=["configured-database", "default-database"])
+def test_neo4j_connection(neo4j_driver, database, logger):
+    """Neo4j 데이터베이스 접속 테스트 (database=None이면 기본 데이터베이스)"""
+    config = _neo4j_config()
+    try:
+        logger.info("=== Neo4j 접속 테스트 시작 ===")
+        logger.info(f"URI: {config.uri}")
+        logger.info(f"Database: {database or '(기본)'}")
+        logger.info(f"User: {config.user}")
+
+        # 드라이버 수준 auto-commit 쿼리로 연결 확인 (명시적 세션/트랜잭션 불필요)
+        kwargs = {"database_": database} if database else {}
+        records, _, _ = neo4j_driver.execute_query("RETURN 1 as test_value", **kwargs)
+        assert records, "쿼리 결과가 없습니다"
+        record = records[0]
+        assert record["test_value"] == 1, f"예상값 1, 실제값: {record['test_value']}"
+
+        logger.info(f"✓ 접속 성공! 테스트 값: {record['test_value']}")
+
+    except Exception as e:
+        logger.error(f"✗ 접속 실패: {str(e)}")
+        logger.error(f"에러 타입: {type(e).__name__}")
+        raise
+
+
+def test_neo4j_database_info(neo4j_session, logger):
+    """Neo4j 데이터베이스 정보 조회 테스트"""
     try:
-        test_instance.test_neo4j_connection()
-        test_instance.test_neo4j_connection_without_database()
-        test_instance.test_neo4j_database_info()
-        print("\n" + "=" * 50)
-        print("✓ 모든 테스트 완료!")
-        print("=" * 50)
+        logger.info("=== Neo4j 데이터베이스 정보 조회 테스트 ===")
+
+        # 데이터베이스 정보 조회
+        # 결과를 리스트로 모으지 않고 스트리밍으로 출력
+        result = neo4j_session.run("CALL db.info()")
+        has_info = False
+        for record in result:
+            if not has_info:
+                logger.info("✓ 데이터베이스 정보 조회 성공")
+                has_info = True
+            logger.info(f"  - {dict(record)}")
+        if not has_info:
+            logger.info("⚠ 데이터베이스 정보가 없습니다")
+
+        # 노드 개수 확인 (단일 레코드만 가져오고 서버 측 결과 즉시 해제)
+        result = neo4j_session.run("MATCH (n) RETURN count(n) as node_count")
+        node_count = result.single(strict=True)["node_count"]
+        result.consume()
+        logger.info(f"  - 총 노드 개수: {node_count}")
+
     except Exception as e:
-        print(f"\n" + "=" * 50)
-        print(f"✗ 테스트 실패: {str(e)}")
-        print("=" * 50)
+        logger.error(f"✗ 데이터베이스 정보 조회 실패: {str(e)}")
+        logger.error(f"에러 타입: {type(e).__name__}")
+        # 이 테스트는 실패해도 전체 테스트를 중단하지 않음
+        pytest.skip(f"데이터베이스 정보 조회 실패: {str(e)}")
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 pytest로 테스트 수행 (fixture 사용을 위해)
+    raise SystemExit(pytest.main([__file__, "-v", "-s"]))
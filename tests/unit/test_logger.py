@@ -0,0 +1,266 @@
+import logging
+import logging.handlers
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from csa.utils import logger as logger_module
+from csa.utils.logger import get_logger, reset_logger_cache
+
+
+@pytest.fixture(autouse=True)
+def clean_logger_cache():
+    reset_logger_cache()
+    yield
+    reset_logger_cache()
+
+def test_get_logger_returns_cached_logger():
+    first = get_logger("csa.test.cache")
+    handlers = list(first.handlers)
+
+    second = get_logger("csa.test.cache")
+
+    assert second is first
+    assert second.handlers == handlers
+
+def test_reset_logger_cache_rebuilds_handlers():
+    first = get_logger("csa.test.reset")
+    old_handlers = list(first.handlers)
+    reset_logger_cache()
+
+    second = get_logger("csa.test.reset")
+
+    assert second is first
+    assert second.handlers
+    assert not set(map(id, second.handlers)) & set(map(id, old_handlers))
+
+@pytest.fixture
+def log_cwd(tmp_path, monkeypatch):
+    """tmp_path를 작업 디렉토리로 사용(INFO 레벨 고정)하고 종료 시 그 아래의 파일 리스너만 정리"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(logger_module, "_ensured_dirs", set())
+    monkeypatch.setattr(logger_module, "_RESOLVED_LOG_LEVEL", logging.INFO)
+    yield tmp_path
+    _stop_listeners_under(tmp_path)
+
+def _stop_listeners_under(log_dir):
+    """다른 테스트 모듈의 리스너는 유지하고 log_dir 아래 파일의 리스너만 정지"""
+    paths = [path for path in logger_module._FILE_LISTENERS if path.startswith(str(log_dir))]
+    logger_module._stop_file_listeners(paths)
+
+def _read_log(log_dir, command_name):
+    (log_file,) = log_dir.glob(f"logs/{command_name}-*.log")
+    return log_file.read_text(encoding='utf-8')
+
+def test_get_logger_reconfigures_when_command_name_alternates(log_cwd):
+    get_logger("csa.test.alternate", "analyze")
+    get_logger("csa.test.alternate", "sequence").info("sequence message")
+    get_logger("csa.test.alternate", "analyze").info("analyze message")
+    _stop_listeners_under(log_cwd)
+
+    assert "analyze message" in _read_log(log_cwd, "analyze")
+    assert "analyze message" not in _read_log(log_cwd, "sequence")
+    assert "sequence message" in _read_log(log_cwd, "sequence")
+
+def test_file_logging_through_queue_listener(log_cwd):
+    logger = get_logger("csa.test.queue", "queue")
+    logger.info("queued %s", "message")
+    try:
+        raise ValueError("queued boom")
+    except ValueError:
+        logger.exception("queued failure")
+    _stop_listeners_under(log_cwd)
+
+    lines = _read_log(log_cwd, "queue").splitlines()
+
+    assert lines[0].endswith("[I] : queued message")
+    assert lines[1].endswith("[E] : queued failure")
+    assert lines[2] == "Traceback (most recent call last):"
+    assert lines[-1] == "ValueError: queued boom"
+    assert not any(path.startswith(str(log_cwd)) for path in logger_module._FILE_LISTENERS)
+
+def test_logger_is_rebuilt_after_listener_stop(log_cwd):
+    logger = get_logger("csa.test.restart", "restart")
+    logger.info("before stop")
+    _stop_listeners_under(log_cwd)
+
+    assert not any(isinstance(h, logging.handlers.QueueHandler) for h in logger.handlers)
+
+    reset_logger_cache()
+    get_logger("csa.test.restart", "restart").info("after stop")
+    _stop_listeners_under(log_cwd)
+
+    content = _read_log(log_cwd, "restart")
+    assert "before stop" in content
+    assert "after stop" in content
+
+def test_get_file_queue_starts_one_listener_per_file(log_cwd):
+    os.makedirs("logs")
+    log_filepath = os.path.join("logs", "concurrent.log")
+    results = []
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        results.append(logger_module._get_file_queue(log_filepath))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(q) for q in results}) == 1
+    assert logger_module._FILE_LISTENERS[os.path.abspath(log_filepath)][0] is results[0]
+
+def test_refresh_log_level_applies_env_change(monkeypatch):
+    # 테스트 종료 시 monkeypatch가 기존 해석 결과를 그대로 복원
+    monkeypatch.setattr(logger_module, "_RESOLVED_LOG_LEVEL", logger_module._RESOLVED_LOG_LEVEL)
+    monkeypatch.setenv("LOG_LEVEL", "error")
+
+    assert logger_module.refresh_log_level() == logging.ERROR
+    assert get_logger("csa.test.level").level == logging.ERROR
+
+def test_format_time_reuses_second_and_updates_msecs():
+    formatter = logger_module.CustomFormatter(datefmt='%Y-%m-%d %H:%M:%S')
+    record = logging.LogRecord("csa.test", logging.INFO, __file__, 1, "msg", None, None)
+    record.created = 1700000000.123
+    record.msecs = 123.0
+    first = formatter.formatTime(record, formatter.datefmt)
+
+    record.created = 1700000000.456
+    record.msecs = 456.9
+    second = formatter.formatTime(record, formatter.datefmt)
+
+    assert first[:-4] == second[:-4]
+    assert first.endswith(".123")
+    assert second.endswith(".456")
+
+def test_buffered_file_handler_flushes_on_close(tmp_path):
+    log_file = tmp_path / "buffered.log"
+    handler = logger_module.BufferedFileHandler(str(log_file), encoding='utf-8', flush_interval=60)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    record = logging.LogRecord("csa.test", logging.INFO, __file__, 1, "buffered line", None, None)
+
+    handler.handle(record)
+    assert log_file.read_text(encoding='utf-8') == ""
+
+    handler.close()
+    assert log_file.read_text(encoding='utf-8') == "buffered line\n"
+
+def test_buffered_file_handler_close_with_lock_held(tmp_path):
+    handler = logger_module.BufferedFileHandler(str(tmp_path / "locked.log"), encoding='utf-8',
+                                                flush_interval=0.01)
+
+    def shutdown_like():
+        # logging.shutdown()과 동일하게 잠금을 잡은 채 flush/close 호출
+        handler.acquire()
+        try:
+            time.sleep(0.1)
+            handler.flush()
+            handler.close()
+        finally:
+            handler.release()
+
+    closer = threading.Thread(target=shutdown_like, daemon=True)
+    closer.start()
+    closer.join(timeout=2)
+
+    assert not closer.is_alive()
+    handler._flusher.join(timeout=2)
+    assert not handler._flusher.is_alive()
+
+def test_cleanup_old_logs_removes_only_expired_log_files(tmp_path):
+    old_log = tmp_path / "old.log"
+    new_log = tmp_path / "new.log"
+    old_other = tmp_path / "old.txt"
+    for path in (old_log, new_log, old_other):
+        path.write_text("x")
+    expired = time.time() - 8 * 24 * 60 * 60
+    os.utime(old_log, (expired, expired))
+    os.utime(old_other, (expired, expired))
+
+    logger_module.cleanup_old_logs(str(tmp_path), days=7)
+
+    assert not old_log.exists()
+    assert new_log.exists()
+    assert old_other.exists()
+
+def test_cleanup_old_logs_daily_skips_recent_run(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(logger_module, "cleanup_old_logs",
+                        lambda log_dir, days=7: calls.append(log_dir))
+
+    logger_module.cleanup_old_logs_daily(str(tmp_path))
+    logger_module.cleanup_old_logs_daily(str(tmp_path))
+
+    assert calls == [str(tmp_path)]
+    assert (tmp_path / ".last_cleanup").exists()
+
+def test_formatter_derives_short_level_from_levelno():
+    record = logging.makeLogRecord({"msg": "msg", "levelno": logging.INFO, "levelname": "INFO"})
+
+    assert logger_module._FORMATTER.format(record).endswith("[I] : msg")
+
+    custom = logging.LogRecord("csa.test", 25, __file__, 1, "custom", None, None)
+    custom.levelname = "NOTICE"
+    assert logger_module._FORMATTER.format(custom).endswith("[N] : custom")
+
+def test_setup_logger_keeps_handlers_for_identical_config():
+    first = logger_module.setup_logger("csa.test.setup_key")
+    handlers = list(first.handlers)
+
+    second = logger_module.setup_logger("csa.test.setup_key")
+
+    assert second is first
+    assert second.handlers == handlers
+
+def test_log_records_skip_unused_attributes():
+    record = logging.getLogger("csa.test.attrs").makeRecord(
+        "csa.test.attrs", logging.INFO, "(unknown file)", 0, "msg", None, None)
+
+    assert record.thread is None
+    assert record.process is None
+
+def test_formatter_appends_exception_text():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.getLogger("csa.test.exc").makeRecord(
+            "csa.test.exc", logging.ERROR, "(unknown file)", 0, "failed %s", ("x",),
+            sys.exc_info())
+
+    lines = logger_module._FORMATTER.format(record).splitlines()
+
+    assert lines[0].endswith("[E] : failed x")
+    assert lines[-1] == "ValueError: boom"
+
+def test_formatter_rejects_other_format_strings():
+    with pytest.raises(ValueError):
+        logger_module.CustomFormatter('%(asctime)s')
+
+    record = logging.LogRecord("csa.test", logging.INFO, __file__, 1, "plain", None, None)
+    formatter = logger_module.CustomFormatter(logger_module.CustomFormatter.LOG_FORMAT)
+    assert formatter.format(record).endswith("[I] : plain")
+
+def test_stack_info_and_caller_location_are_kept():
+    records = []
+
+    class ListHandler(logging.Handler):
+        def emit(self, record):
+            records.append(record)
+
+    logger = logging.getLogger("csa.test.stack")
+    handler = ListHandler()
+    logger.addHandler(handler)
+    try:
+        logger.error("with stack", stack_info=True)
+    finally:
+        logger.removeHandler(handler)
+
+    (record,) = records
+    assert record.filename == "test_logger.py"
+    assert "Stack (most recent call last)" in logger_module._FORMATTER.format(record)